@@ -3,7 +3,7 @@ from typing import List, Dict, Optional
 from src.config.config import get_logger
 logger = get_logger()
 
-from app.schemas.vectordb import CollectionCreate, CollectionStatsRequest, DataInsert, DeleteRequest, HybridSearchRequest, QueryRequest, UpdateRequest
+from app.schemas.vectordb import CollectionCreate, CollectionStatsRequest, DataInsert, DeleteRequest, HybridSearchRequest, QueryRequest, TenantsCreate, TenantsStatusUpdate, UpdateRequest
 from app.services.vectordb import (create_collection as create_collection_service,
         insert_data as insert_data_service,
         query_data as query_data_service,
@@ -12,6 +12,9 @@ from app.services.vectordb import (create_collection as create_collection_servic
         delete_collection as delete_collection_service,
         hybrid_search as hybrid_search_service,
         get_collection_stats as get_collection_stats_service,
+        create_tenants as create_tenants_service,
+        get_tenants as get_tenants_service,
+        update_tenants_status as update_tenants_status_service,
         close_connection as close_connection_service)
 
 
@@ -25,61 +28,42 @@ async def create_collection(request: CollectionCreate):
     """
     Create a new collection in Weaviate.
     """
-    return create_collection_service(
-        collection_name=request.collection_name,
-        vectorizer=request.vectorizer,
-        properties=request.properties
-    )
+    return create_collection_service(request)
 
 @router.post("/data/insert", response_model=int)
 async def insert_data(request: DataInsert):
     """
     Insert data objects into a collection.
     """
-    return insert_data_service(
-            collection_name=request.collection_name,
-            data_objects=request.data_objects
-        )
+    return insert_data_service(request)
 
 @router.post("/data/query", response_model=List[Dict])
 async def query_data(request: QueryRequest):
     """
     Query data from a collection using near-text search.
     """
-    return query_data_service(
-        collection_name=request.collection_name,
-        query=request.query,
-        limit=request.limit,
-        with_vectors=request.with_vectors
-    )
+    return query_data_service(request)
 
 @router.put("/data/update", response_model=bool)
 async def update_data(request: UpdateRequest):
     """
     Update a data object in a collection.
     """
-    return update_data_service(
-        collection_name=request.collection_name,
-        object_id=request.object_id,
-        data_object=request.data_object
-    )
+    return update_data_service(request)
 
 @router.delete("/data/delete", response_model=bool)
 async def delete_data(request: DeleteRequest):
     """
     Delete a data object from a collection.
     """
-    return delete_data_service(
-        collection_name=request.collection_name,
-        object_id=request.object_id
-    )
+    return delete_data_service(request)
 
 @router.delete("/collection/delete", response_model=bool)
 async def delete_collection(request: CollectionStatsRequest):
     """
     Delete a collection from Weaviate.
     """
-    return delete_collection_service(collection_name=request.collection_name)
+    return delete_collection_service(request)
         
 
 @router.post("/data/hybrid-search", response_model=List[Dict])
@@ -87,12 +71,7 @@ async def hybrid_search(request: HybridSearchRequest):
     """
     Perform a hybrid search combining vector and keyword search.
     """
-    return hybrid_search_service(
-        collection_name=request.collection_name,
-        query=request.query,
-        alpha=request.alpha,
-        limit=request.limit
-    )
+    return hybrid_search_service(request)
     
 @router.get("/collection/stats", response_model=Dict)
 async def get_collection_stats(collection_name: str):
@@ -101,6 +80,27 @@ async def get_collection_stats(collection_name: str):
     """
     return get_collection_stats_service(collection_name=collection_name)
 
+@router.post("/tenants/create", response_model=int)
+async def create_tenants(request: TenantsCreate):
+    """
+    Create tenants in a multi-tenant collection.
+    """
+    return create_tenants_service(request)
+
+@router.get("/tenants/list", response_model=Dict[str, str])
+async def get_tenants(collection_name: str):
+    """
+    List the tenants of a collection with their activity status.
+    """
+    return get_tenants_service(collection_name=collection_name)
+
+@router.put("/tenants/status", response_model=bool)
+async def update_tenants_status(request: TenantsStatusUpdate):
+    """
+    Activate, deactivate or offload tenants of a collection.
+    """
+    return update_tenants_status_service(request)
+
 @router.post("/close", response_model=bool)
 async def close_connection():
     """
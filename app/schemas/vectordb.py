@@ -1,36 +1,53 @@
 from pydantic import BaseModel
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Literal
 
 # Pydantic models for request validation
 class CollectionCreate(BaseModel):
     collection_name: str
     vectorizer: str = "text2vec-model2vec"
     properties: Optional[List[Dict]] = None
+    multi_tenancy: bool = False
+    auto_tenant_creation: bool = False
+    auto_tenant_activation: bool = False
 
 class DataInsert(BaseModel):
     collection_name: str
     data_objects: List[Dict]
+    tenant: Optional[str] = None
 
 class QueryRequest(BaseModel):
     collection_name: str
     query: str
     limit: int = 10
     with_vectors: bool = False
+    tenant: Optional[str] = None
 
 class UpdateRequest(BaseModel):
     collection_name: str
     object_id: str
     data_object: Dict
+    tenant: Optional[str] = None
 
 class DeleteRequest(BaseModel):
     collection_name: str
     object_id: str
+    tenant: Optional[str] = None
 
 class HybridSearchRequest(BaseModel):
     collection_name: str
     query: str
     alpha: float = 0.5
     limit: int = 10
+    tenant: Optional[str] = None
 
 class CollectionStatsRequest(BaseModel):
-    collection_name: str
\ No newline at end of file
+    collection_name: str
+
+class TenantsCreate(BaseModel):
+    collection_name: str
+    tenants: List[str]
+
+class TenantsStatusUpdate(BaseModel):
+    collection_name: str
+    tenants: List[str]
+    activity_status: Literal["ACTIVE", "INACTIVE", "OFFLOADED"] = "INACTIVE"
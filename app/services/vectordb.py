@@ -1,5 +1,5 @@
 from typing import Dict
-from app.schemas.vectordb import CollectionCreate, CollectionStatsRequest, DataInsert, DeleteRequest, HybridSearchRequest, QueryRequest, UpdateRequest
+from app.schemas.vectordb import CollectionCreate, CollectionStatsRequest, DataInsert, DeleteRequest, HybridSearchRequest, QueryRequest, TenantsCreate, TenantsStatusUpdate, UpdateRequest
 from src.weaviate_db import WeaviateDB
 import os
 
@@ -10,14 +10,18 @@ def create_collection(request: CollectionCreate):
     success = db.create_collection(
         collection_name=request.collection_name,
         vectorizer=request.vectorizer,
-        properties=request.properties
+        properties=request.properties,
+        multi_tenancy=request.multi_tenancy,
+        auto_tenant_creation=request.auto_tenant_creation,
+        auto_tenant_activation=request.auto_tenant_activation
     )
     return success
 
 def insert_data(request: DataInsert):
     inserted_count = db.insert_data(
         collection_name=request.collection_name,
-        data_objects=request.data_objects
+        data_objects=request.data_objects,
+        tenant=request.tenant
     )
     if inserted_count == 0:
         raise Exception("No data was inserted.")
@@ -28,7 +32,8 @@ def query_data(request: QueryRequest):
         collection_name=request.collection_name,
         query=request.query,
         limit=request.limit,
-        with_vectors=request.with_vectors
+        with_vectors=request.with_vectors,
+        tenant=request.tenant
     )
     return results
 
@@ -36,7 +41,8 @@ def update_data(request: UpdateRequest):
     success = db.update_data(
         collection_name=request.collection_name,
         object_id=request.object_id,
-        data_object=request.data_object
+        data_object=request.data_object,
+        tenant=request.tenant
     )
     if not success:
         raise Exception(f"Failed to update object {request.object_id}")
@@ -45,7 +51,8 @@ def update_data(request: UpdateRequest):
 def delete_data(request: DeleteRequest):
     success = db.delete_data(
         collection_name=request.collection_name,
-        object_id=request.object_id
+        object_id=request.object_id,
+        tenant=request.tenant
     )
     if not success:
         raise Exception(f"Failed to delete object {request.object_id}")
@@ -62,7 +69,8 @@ def hybrid_search(request: HybridSearchRequest):
         collection_name=request.collection_name,
         query=request.query,
         alpha=request.alpha,
-        limit=request.limit
+        limit=request.limit,
+        tenant=request.tenant
     )
     return results
 
@@ -70,6 +78,29 @@ async def get_collection_stats(collection_name: str):
     stats = db.get_collection_stats(collection_name=collection_name)
     return stats
 
+def create_tenants(request: TenantsCreate):
+    created_count = db.create_tenants(
+        collection_name=request.collection_name,
+        tenants=request.tenants
+    )
+    if created_count == 0:
+        raise Exception("No tenants were created.")
+    return created_count
+
+def get_tenants(collection_name: str):
+    tenants = db.get_tenants(collection_name=collection_name)
+    return tenants
+
+def update_tenants_status(request: TenantsStatusUpdate):
+    success = db.update_tenants_status(
+        collection_name=request.collection_name,
+        tenants=request.tenants,
+        activity_status=request.activity_status
+    )
+    if not success:
+        raise Exception(f"Failed to set tenants to {request.activity_status}")
+    return success
+
 def close_connection():
     db.close()
     return True
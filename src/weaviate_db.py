@@ -26,9 +26,20 @@ class WeaviateDB:
         except Exception as e:
             raise
 
+    def _get_collection(self, collection_name: str, tenant: Optional[str] = None):
+        """
+        Get a collection handle, scoped to a tenant when one is given.
+        """
+        collection = self.client.collections.get(collection_name)
+        if tenant:
+            collection = collection.with_tenant(tenant)
+        return collection
+
     def create_collection(self, collection_name: str, vectorizer: str = "text2vec-openai",
-                          properties: Optional[List[Dict]] = None) -> bool:
-        if collection_name in self.client.collections.list_all():
+                          properties: Optional[List[Dict]] = None, multi_tenancy: bool = False,
+                          auto_tenant_creation: bool = False,
+                          auto_tenant_activation: bool = False) -> bool:
+        if self.client.collections.exists(collection_name):
             return False
 
         config = wvc.config.Configure.Vectorizer.none()
@@ -42,14 +53,20 @@ class WeaviateDB:
         self.client.collections.create(
             name=collection_name,
             vector_config=config,
+            multi_tenancy_config=wvc.config.Configure.multi_tenancy(
+                enabled=True,
+                auto_tenant_creation=auto_tenant_creation,
+                auto_tenant_activation=auto_tenant_activation,
+            ) if multi_tenancy else None,
         )
         return True
 
-    def insert_data(self, collection_name: str, data_objects: List[Dict]) -> int:
+    def insert_data(self, collection_name: str, data_objects: List[Dict],
+                    tenant: Optional[str] = None) -> int:
         """
         Insert multiple objects into a collection.
         """
-        collection = self.client.collections.get(collection_name)
+        collection = self._get_collection(collection_name, tenant)
         inserted_count = 0
         with collection.batch.dynamic() as batch:
             for obj in data_objects:
@@ -58,11 +75,11 @@ class WeaviateDB:
         return inserted_count
 
     def query_data(self, collection_name: str, query: str, limit: int = 10,
-                   with_vectors: bool = False) -> List[Dict]:
+                   with_vectors: bool = False, tenant: Optional[str] = None) -> List[Dict]:
         """
         Perform a near-text query on a collection.
         """
-        collection = self.client.collections.get(collection_name)
+        collection = self._get_collection(collection_name, tenant)
         result = collection.query.near_text(
             query=query,
             limit=limit,
@@ -70,22 +87,24 @@ class WeaviateDB:
         )
         return [obj.properties | {"_metadata": obj.metadata.dict()} for obj in result.objects]
 
-    def update_data(self, collection_name: str, object_id: str, data_object: Dict) -> bool:
+    def update_data(self, collection_name: str, object_id: str, data_object: Dict,
+                    tenant: Optional[str] = None) -> bool:
         """
         Update an object in a collection.
         """
-        collection = self.client.collections.get(collection_name)
+        collection = self._get_collection(collection_name, tenant)
         collection.data.update(
             uuid=object_id,
             properties=data_object
         )
         return True
 
-    def delete_data(self, collection_name: str, object_id: str) -> bool:
+    def delete_data(self, collection_name: str, object_id: str,
+                    tenant: Optional[str] = None) -> bool:
         """
         Delete an object from a collection.
         """
-        collection = self.client.collections.get(collection_name)
+        collection = self._get_collection(collection_name, tenant)
         collection.data.delete(uuid=object_id)
         return True
 
@@ -97,11 +116,11 @@ class WeaviateDB:
         return True
 
     def hybrid_search(self, collection_name: str, query: str, alpha: float = 0.5,
-                      limit: int = 10) -> List[Dict]:
+                      limit: int = 10, tenant: Optional[str] = None) -> List[Dict]:
         """
         Perform a hybrid search (BM25 + vector).
         """
-        collection = self.client.collections.get(collection_name)
+        collection = self._get_collection(collection_name, tenant)
         result = collection.query.hybrid(
             query=query,
             alpha=alpha,
@@ -115,6 +134,35 @@ class WeaviateDB:
         """
         return self.client.collections.get(collection_name).config
 
+    def create_tenants(self, collection_name: str, tenants: List[str]) -> int:
+        """
+        Create multiple tenants in a multi-tenant collection in one request.
+        """
+        collection = self.client.collections.get(collection_name)
+        collection.tenants.create([wvc.tenants.Tenant(name=name) for name in tenants])
+        return len(tenants)
+
+    def get_tenants(self, collection_name: str) -> Dict[str, str]:
+        """
+        Get all tenants of a collection with their activity status.
+        """
+        collection = self.client.collections.get(collection_name)
+        return {name: tenant.activity_status.value
+                for name, tenant in collection.tenants.get().items()}
+
+    def update_tenants_status(self, collection_name: str, tenants: List[str],
+                              activity_status: str = "INACTIVE") -> bool:
+        """
+        Set the activity status of tenants (ACTIVE, INACTIVE or OFFLOADED).
+        Only ACTIVE tenants are loaded in memory on the cluster.
+        """
+        status = wvc.tenants.TenantActivityStatus(activity_status)
+        collection = self.client.collections.get(collection_name)
+        collection.tenants.update(
+            [wvc.tenants.Tenant(name=name, activity_status=status) for name in tenants]
+        )
+        return True
+
     def close(self):
         """
         Close the Weaviate client connection.